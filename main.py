@@ -8,11 +8,19 @@ through the GoDaddy API.
 
 import os
 import sys
+import asyncio
 from dotenv import load_dotenv
 from src.ui.cli import DomainCLI
 from src.api.godaddy_client import GoDaddyClient
 from src.utils.config import setup_logger
 
+async def run(cli, godaddy_client):
+    """Run the CLI and release the API client's connections on exit."""
+    try:
+        await cli.start()
+    finally:
+        await godaddy_client.close()
+
 def main():
     """Main entry point for the application."""
     # Load environment variables
@@ -38,7 +46,7 @@ def main():
     cli = DomainCLI(godaddy_client)
     
     # Start the domain management flow
-    cli.start()
+    asyncio.run(run(cli, godaddy_client))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
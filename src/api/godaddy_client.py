@@ -2,15 +2,80 @@
 GoDaddy API client for interacting with the GoDaddy API.
 """
 
-import requests
+import aiohttp
+import asyncio
+import functools
+import hashlib
 import logging
-import json
+import orjson
 import time
+from cachetools import TTLCache
+
+try:
+    # Enables aiohttp's non-blocking AsyncResolver
+    import aiodns
+except ImportError:
+    aiodns = None
+
+# Seconds an idle connection (and its TLS session) is kept for reuse
+_KEEPALIVE_TIMEOUT = 30
+
+# Seconds resolved API host addresses are cached
+_DNS_CACHE_TTL = 600
+
+# Order statuses after which polling stops
+_ORDER_FINAL_STATUSES = frozenset({"COMPLETE", "CANCELLED", "FAILED"})
+
+# Fixed endpoints bound to request callables as self._<name> on each client:
+# name -> (HTTP method, endpoint, cacheable)
+_ENDPOINTS = {
+    "available": ("POST", "domains/available", True),
+    "suggest": ("GET", "domains/suggest", True),
+    "purchase": ("POST", "domains/purchase", False),
+}
+
+# Contact roles accepted by the purchase endpoint
+_CONTACT_TYPES = ("contactAdmin", "contactBilling", "contactRegistrant", "contactTech")
+
+# (GoDaddy field, our field, default) pairs for a contact
+_CONTACT_FIELD_MAP = (
+    ("nameFirst", "firstName", ""),
+    ("nameLast", "lastName", ""),
+    ("email", "email", ""),
+    ("phone", "phone", ""),
+)
+
+# (GoDaddy field, our field, default) pairs for a contact's mailing address
+_ADDRESS_FIELD_MAP = (
+    ("address1", "addressLine1", ""),
+    ("address2", "addressLine2", ""),
+    ("city", "city", ""),
+    ("state", "state", ""),
+    ("postalCode", "postalCode", ""),
+    ("country", "country", "US"),
+)
+
+def _format_contact(contact_info):
+    """
+    Convert a contact from our format to GoDaddy's expected format.
+    
+    Args:
+        contact_info (dict): Contact information using our field names
+        
+    Returns:
+        dict: Contact information using GoDaddy's field names
+    """
+    formatted_contact = {dest: contact_info.get(src, default) for dest, src, default in _CONTACT_FIELD_MAP}
+    formatted_contact["addressMailing"] = {
+        dest: contact_info.get(src, default) for dest, src, default in _ADDRESS_FIELD_MAP
+    }
+    return formatted_contact
 
 class GoDaddyClient:
     """Client for interacting with the GoDaddy API."""
     
-    def __init__(self, api_key, api_secret, api_url="https://api.godaddy.com"):
+    def __init__(self, api_key, api_secret, api_url="https://api.godaddy.com",
+                 max_concurrency=50, max_per_endpoint=8, cache_ttl=300):
         """
         Initialize the GoDaddy API client.
         
@@ -18,29 +83,96 @@ class GoDaddyClient:
             api_key (str): GoDaddy API key
             api_secret (str): GoDaddy API secret
             api_url (str): GoDaddy API base URL
+            max_concurrency (int): Maximum number of requests in flight
+            max_per_endpoint (int): Maximum number of requests in flight per endpoint
+            cache_ttl (int): Seconds to keep cached responses of read-only lookups
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.api_url = api_url
         self.api_version = "v1"
-        self.logger = logging.getLogger("domain_manager")
         
-        # Session for connection pooling and reuse
-        self.session = requests.Session()
+        # Ensure API URL has https:// prefix and no trailing slash
+        base_url = api_url if api_url.startswith("http") else f"https://{api_url}"
+        self._base = f"{base_url.rstrip('/')}/{self.api_version}"
         
-        # Set default headers for all requests
-        self.session.headers.update({
+        self.max_concurrency = max_concurrency
+        self.max_per_endpoint = max_per_endpoint
+        self.logger = logging.getLogger("domain_manager")
+        
+        # Default headers for all requests
+        self._headers = {
             "Authorization": f"sso-key {api_key}:{api_secret}",
             "Content-Type": "application/json",
             "Accept": "application/json"
-        })
+        }
+        
+        # Session for connection pooling and reuse, created on first use
+        # because aiohttp sessions must be built inside a running event loop
+        self._session = None
+        
+        # Concurrency limits, created alongside the session for the same reason
+        self._global_sem = None
+        self._endpoint_sems = {}
+        
+        # Cache for read-only lookups (availability, suggestions, details)
+        self._get_cache = TTLCache(maxsize=10_000, ttl=cache_ttl)
+        
+        # Request callables for the fixed endpoints with method, endpoint
+        # and caching already bound
+        for name, (method, endpoint, cache) in _ENDPOINTS.items():
+            setattr(self, f"_{name}", functools.partial(self._make_request, method, endpoint, cache=cache))
+    
+    async def _ensure_session(self):
+        """
+        Return the shared HTTP session, creating it if needed.
+        
+        Returns:
+            aiohttp.ClientSession: Session used for all API requests
+        """
+        if self._session is None or self._session.closed:
+            # All requests go to a single host, so size the pool to the
+            # concurrency limit and keep connections alive between calls.
+            # Resolve through aiodns when available instead of blocking a
+            # thread on getaddrinfo.
+            connector = aiohttp.TCPConnector(
+                resolver=aiohttp.AsyncResolver() if aiodns else None,
+                limit=self.max_concurrency,
+                limit_per_host=self.max_concurrency,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._headers,
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+            self._global_sem = asyncio.Semaphore(self.max_concurrency)
+            self._endpoint_sems = {}
+        return self._session
+    
+    def _endpoint_semaphore(self, endpoint_key):
+        """
+        Return the semaphore limiting concurrent requests to an endpoint.
+        
+        Args:
+            endpoint_key (str): API endpoint template, e.g. "domains/{domain}"
+            
+        Returns:
+            asyncio.Semaphore: Semaphore for the endpoint
+        """
+        sem = self._endpoint_sems.get(endpoint_key)
+        if sem is None:
+            sem = self._endpoint_sems[endpoint_key] = asyncio.Semaphore(self.max_per_endpoint)
+        return sem
     
-    def __del__(self):
-        """Clean up resources when the object is destroyed."""
-        if hasattr(self, 'session'):
-            self.session.close()
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
-    def _make_request(self, method, endpoint, data=None, params=None):
+    async def _make_request(self, method, endpoint, data=None, params=None, cache=False, endpoint_key=None):
         """
         Make a request to the GoDaddy API.
         
@@ -49,56 +181,64 @@ class GoDaddyClient:
             endpoint (str): API endpoint
             data (dict, optional): Data to send in the request
             params (dict, optional): Query parameters
+            cache (bool): Whether the response may be served from and stored
+                in the lookup cache. Only set for read-only requests.
+            endpoint_key (str, optional): Endpoint template used for the
+                per-endpoint concurrency limit when the endpoint contains
+                a domain or ID. Defaults to the endpoint itself.
             
         Returns:
             dict: Response data or error
         """
-        # Ensure API URL has https:// prefix and no trailing slash
-        api_url = self.api_url
-        if not api_url.startswith("http"):
-            api_url = f"https://{api_url}"
-        api_url = api_url.rstrip("/")
+        if cache:
+            key = hashlib.md5(orjson.dumps(
+                {"m": method, "e": endpoint, "p": params, "d": data}, option=orjson.OPT_SORT_KEYS
+            )).digest()
+            if key in self._get_cache:
+                return self._get_cache[key]
+            
+            result = await self._make_request(method, endpoint, data=data, params=params, endpoint_key=endpoint_key)
+            # Skip errors, including per-domain failures of a bulk availability check
+            if "error" not in result and not (isinstance(result, dict) and result.get("errors")):
+                self._get_cache[key] = result
+            return result
         
-        url = f"{api_url}/{self.api_version}/{endpoint}"
+        url = f"{self._base}/{endpoint}"
+        session = await self._ensure_session()
         
         try:
-            if method.upper() == "GET":
-                response = self.session.get(url, params=params)
-            elif method.upper() == "POST":
-                response = self.session.post(url, json=data, params=params)
-            elif method.upper() == "PUT":
-                response = self.session.put(url, json=data, params=params)
-            elif method.upper() == "PATCH":
-                response = self.session.patch(url, json=data, params=params)
-            elif method.upper() == "DELETE":
-                response = self.session.delete(url, params=params)
-            else:
-                self.logger.error(f"Unsupported HTTP method: {method}")
-                return {"error": f"Unsupported HTTP method: {method}"}
-            
-            # Check for successful response
-            response.raise_for_status()
-            
-            # Return JSON response if content exists
-            if response.text:
-                return response.json()
-            return {"success": True}
-            
-        except requests.exceptions.HTTPError as e:
-            self.logger.error(f"HTTP error occurred: {e}")
-            
-            # Try to parse the error response
-            try:
-                error_data = response.json()
-                return {"error": error_data}
-            except:
-                return {"error": str(e)}
+            async with self._global_sem, self._endpoint_semaphore(endpoint_key or endpoint), \
+                    session.request(method, url, params=params, json=data) as response:
+                # Check for successful response
+                if response.status >= 400:
+                    self.logger.error(
+                        f"HTTP error occurred: {response.status} {response.reason} for url: {response.url}"
+                    )
+                    
+                    # Try to parse the error response
+                    try:
+                        error_data = orjson.loads(await response.read())
+                        return {"error": error_data}
+                    except orjson.JSONDecodeError:
+                        return {"error": f"{response.status} {response.reason}"}
+                
+                # Return JSON response if content exists
+                body = await response.read()
+                if not body:
+                    return {"success": True}
+
+                try:
+                    return orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    # Proxies and captive portals may answer 200 with an HTML page
+                    self.logger.error(f"Invalid JSON response from url: {response.url}")
+                    return {"error": f"Invalid JSON response ({response.content_type})"}
             
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request error occurred: {e}")
-            return {"error": str(e)}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Request error occurred: {e!r}")
+            return {"error": str(e) or "Request timed out"}
     
-    def check_domain_availability(self, domain):
+    async def check_domain_availability(self, domain):
         """
         Check if a domain is available for purchase.
         
@@ -108,13 +248,40 @@ class GoDaddyClient:
         Returns:
             dict: Domain availability information
         """
-        self.logger.info(f"Checking availability for domain: {domain}")
-        endpoint = f"domains/available"
-        params = {"domain": domain}
+        result = await self.check_domains_availability([domain])
         
-        return self._make_request("GET", endpoint, params=params)
+        if "error" in result:
+            return result
+        
+        domains = result.get("domains") or []
+        if not domains:
+            errors = result.get("errors") or []
+            return {"error": errors[0] if errors else f"No availability data returned for {domain}"}
+        
+        return domains[0]
+    
+    async def check_domains_availability(self, domains, check_type="FAST"):
+        """
+        Check availability for several domains in a single request.
+        
+        Args:
+            domains (list): Domain names to check
+            check_type (str): GoDaddy check type, FAST or FULL
+        
+        Returns:
+            dict: Availability information with a "domains" list and,
+                for domains that could not be checked, an "errors" list
+        """
+        domains = list(domains)
+        if len(domains) == 1:
+            self.logger.info(f"Checking availability for domain: {domains[0]}")
+        else:
+            self.logger.info(f"Checking availability for {len(domains)} domains: {', '.join(domains)}")
+        params = {"checkType": check_type}
+        
+        return await self._available(data=domains, params=params)
     
-    def search_domains(self, keyword, tlds=None, suggestions=True):
+    async def search_domains(self, keyword, tlds=None, suggestions=True, limit=20):
         """
         Search for available domains based on a keyword.
         
@@ -122,25 +289,59 @@ class GoDaddyClient:
             keyword (str): Keyword to search for
             tlds (list, optional): List of TLDs to search
             suggestions (bool): Whether to include domain suggestions
+            limit (int): Maximum number of results
             
         Returns:
             dict: Domain search results
         """
         self.logger.info(f"Searching domains with keyword: {keyword}")
         
-        endpoint = "domains/suggest"
         params = {
             "query": keyword,
-            "limit": 20,
+            "limit": limit,
             "waitMs": 1000
         }
         
         if tlds:
             params["tlds"] = ",".join(tlds)
         
-        return self._make_request("GET", endpoint, params=params)
+        return await self._suggest(params=params)
     
-    def get_domain_details(self, domain):
+    async def get_suggested_with_availability(self, keyword, tlds=None, limit=20):
+        """
+        Search for domains and attach availability and pricing to each result.
+        
+        Args:
+            keyword (str): Keyword to search for
+            tlds (list, optional): List of TLDs to search
+            limit (int): Maximum number of results
+            
+        Returns:
+            list: Domain search results merged with their availability
+                information, or a dict with an error
+        """
+        suggestions = await self.search_domains(keyword, tlds=tlds, limit=limit)
+        
+        if "error" in suggestions or not suggestions:
+            return suggestions
+        
+        domains = [suggestion["domain"] for suggestion in suggestions]
+        
+        if len(domains) > 1:
+            result = await self.check_domains_availability(domains)
+            availability = result.get("domains", [])
+        else:
+            result = await self.check_domain_availability(domains[0])
+            availability = [result]
+        
+        if "error" in result:
+            self.logger.warning(f"Could not check availability of suggestions: {result['error']}")
+            return suggestions
+        
+        by_domain = {info["domain"]: info for info in availability}
+        return [{**suggestion, **by_domain.get(suggestion["domain"], {})} for suggestion in suggestions]
+    
+    async def get_domain_details(self, domain):
         """
         Get details for a specific domain.
         
@@ -153,9 +354,9 @@ class GoDaddyClient:
         self.logger.info(f"Getting details for domain: {domain}")
         endpoint = f"domains/{domain}"
         
-        return self._make_request("GET", endpoint)
+        return await self._make_request("GET", endpoint, cache=True, endpoint_key="domains/{domain}")
     
-    def purchase_domain(self, domain, purchase_options):
+    async def purchase_domain(self, domain, purchase_options, await_completion=False, timeout=600):
         """
         Purchase a domain.
         
@@ -168,9 +369,13 @@ class GoDaddyClient:
                 - renewAuto
                 - privacy
                 - contactAdmin, contactBilling, contactRegistrant, contactTech
+            await_completion (bool): Poll the order until it completes, fails
+                or is cancelled instead of returning as soon as it is placed
+            timeout (float): Maximum seconds to wait when await_completion is set
             
         Returns:
-            dict: Purchase result
+            dict: Purchase result, or the final order status when
+                await_completion is set
         """
         self.logger.info(f"Purchasing domain: {domain}")
         
@@ -188,43 +393,27 @@ class GoDaddyClient:
             "privacy": purchase_options.get("privacy", True)
         }
         
-        # Format and add contact information
-        contact_types = ["contactAdmin", "contactBilling", "contactRegistrant", "contactTech"]
-        for contact_type in contact_types:
+        # Format and add contact information. The same contact is usually
+        # given for every role, so each distinct contact is formatted once.
+        formatted_contacts = {}
+        for contact_type in _CONTACT_TYPES:
             if contact_type in purchase_options:
                 contact_info = purchase_options[contact_type]
-                
-                # Convert from our format to GoDaddy's expected format
-                formatted_contact = {
-                    "nameFirst": contact_info.get("firstName", ""),
-                    "nameLast": contact_info.get("lastName", ""),
-                    "email": contact_info.get("email", ""),
-                    "phone": contact_info.get("phone", ""),
-                    "addressMailing": {
-                        "address1": contact_info.get("addressLine1", ""),
-                        "address2": contact_info.get("addressLine2", ""),
-                        "city": contact_info.get("city", ""),
-                        "state": contact_info.get("state", ""),
-                        "postalCode": contact_info.get("postalCode", ""),
-                        "country": contact_info.get("country", "US")
-                    }
-                }
-                
-                # Add to data
-                data[contact_type] = formatted_contact
+                key = id(contact_info)
+                if key not in formatted_contacts:
+                    formatted_contacts[key] = _format_contact(contact_info)
+                data[contact_type] = formatted_contacts[key]
         
         # Add nameServers if provided
         if "nameServers" in purchase_options:
             data["nameServers"] = purchase_options["nameServers"]
             
-        # Initiate purchase
-        endpoint = "domains/purchase"
-        
         # Log the request for debugging
-        self.logger.debug(f"Purchase request: {json.dumps(data)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Purchase request: %s", orjson.dumps(data).decode())
         
         # Make initial purchase request
-        result = self._make_request("POST", endpoint, data=data)
+        result = await self._purchase(data=data)
         
         if "error" in result:
             self.logger.error(f"Domain purchase error: {result['error']}")
@@ -236,19 +425,23 @@ class GoDaddyClient:
             print(f"\nPlease complete payment at: {result['paymentUrl']}")
             print("Scan the QR code with your UPI app to complete the purchase.")
             
-            # In a real application, we would now poll for payment status
-            # For now, we'll just return the payment information
+            if await_completion:
+                return await self.wait_for_order(result.get("orderId", ""), timeout=timeout)
+            
             return {
                 "status": "pending_payment",
                 "orderId": result.get("orderId", ""),
                 "paymentUrl": result.get("paymentUrl", ""),
                 "message": "Please complete the payment to finalize domain purchase"
             }
+        
+        if await_completion and result.get("orderId"):
+            return await self.wait_for_order(result["orderId"], timeout=timeout)
             
         return result
 
     # Add a new method to check order status
-    def check_order_status(self, order_id):
+    async def check_order_status(self, order_id):
         """
         Check the status of a domain order.
         
@@ -261,9 +454,38 @@ class GoDaddyClient:
         self.logger.info(f"Checking status for order: {order_id}")
         endpoint = f"orders/{order_id}"
         
-        return self._make_request("GET", endpoint)
+        return await self._make_request("GET", endpoint, endpoint_key="orders/{order_id}")
     
-    def get_suggested_domains(self, domain_name, tlds=None, limit=5):
+    async def wait_for_order(self, order_id, timeout=600, initial=1.0, factor=1.5, cap=15.0):
+        """
+        Poll an order with exponential backoff until it reaches a final status.
+        
+        Args:
+            order_id (str): Order ID to poll
+            timeout (float): Maximum seconds to wait in total
+            initial (float): Delay in seconds before the second poll
+            factor (float): Multiplier applied to the delay after each poll
+            cap (float): Maximum delay in seconds between polls
+            
+        Returns:
+            dict: Final order status information or error
+        """
+        async def _poll():
+            delay = initial
+            while True:
+                status = await self.check_order_status(order_id)
+                if "error" in status or status.get("status") in _ORDER_FINAL_STATUSES:
+                    return status
+                await asyncio.sleep(delay)
+                delay = min(delay * factor, cap)
+        
+        try:
+            return await asyncio.wait_for(_poll(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(f"Timed out waiting for order {order_id}")
+            return {"error": f"Timed out after {timeout} seconds waiting for order {order_id}"}
+    
+    async def get_suggested_domains(self, domain_name, tlds=None, limit=5):
         """
         Get suggested domains similar to the provided domain name.
         
@@ -277,8 +499,6 @@ class GoDaddyClient:
         """
         self.logger.info(f"Getting suggested domains for: {domain_name}")
         
-        endpoint = "domains/suggest"
-        
         # Extract the keyword from the domain name (remove TLD)
         keyword = domain_name.split('.')[0]
         
@@ -290,7 +510,7 @@ class GoDaddyClient:
         if tlds:
             params["tlds"] = ",".join(tlds)
         
-        result = self._make_request("GET", endpoint, params=params)
+        result = await self._suggest(params=params)
         
         if "error" in result:
             return []
@@ -2,21 +2,89 @@
 Command-line interface for the GoDaddy Domain Management tool.
 """
 
-import os
 import sys
-import time
+import asyncio
 import logging
-import inquirer
-import pyfiglet
+from cachetools import TTLCache
 from colorama import init, Fore, Style
 from src.utils.validators import validate_domain_name, validate_email, validate_phone
 
 # Initialize colorama
 init(autoreset=True)
 
+# Maximum number of API results remembered per CLI session
+_CACHE_MAX = 64
+
+# Seconds a remembered result (which includes availability and price) is reused
+_CACHE_TTL = 300
+
+# Shown when a numeric prompt gets something that is not a number
+_NOT_A_NUMBER = f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}"
+
+# GoDaddy prices are given in micro-units of the currency
+_MICROS = 1_000_000
+
+# ANSI sequence to clear the screen and move the cursor home
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Menus, each written to stdout in a single call
+_MAIN_MENU = (
+    f"{Fore.CYAN}MAIN MENU{Style.RESET_ALL}\n"
+    "1. Check domain availability\n"
+    "2. Search for domains\n"
+    "3. Purchase a domain\n"
+    "4. Reset contact info\n"
+    "5. Exit\n"
+)
+
+_TLD_MENU = (
+    f"{Fore.CYAN}Select TLD options:{Style.RESET_ALL}\n"
+    "1. All popular TLDs\n"
+    "2. .com, .net, .org only\n"
+    "3. .io, .dev, .tech (tech domains)\n"
+    "4. .ai, .app, .co (startup domains)\n"
+    "5. Custom selection\n"
+)
+
+_PERIOD_MENU = (
+    f"{Fore.CYAN}Select registration period:{Style.RESET_ALL}\n"
+    "1. 1 year\n"
+    "2. 2 years\n"
+    "3. 3 years\n"
+    "4. 5 years\n"
+    "5. 10 years\n"
+)
+
+_PRIVACY_MENU = (
+    f"{Fore.CYAN}Would you like to add privacy protection?{Style.RESET_ALL}\n"
+    "1. Yes, protect my personal information\n"
+    "2. No, make my information public\n"
+)
+
+_RENEW_MENU = (
+    f"{Fore.CYAN}Would you like to enable auto-renewal?{Style.RESET_ALL}\n"
+    "1. Yes, automatically renew this domain\n"
+    "2. No, I will renew manually\n"
+)
+
+def _fmt_price(micros):
+    """
+    Format a GoDaddy price for display.
+    
+    Args:
+        micros (int): Price in micro-units of the currency
+        
+    Returns:
+        str: Price formatted as dollars and cents
+    """
+    return f"${micros / _MICROS:.2f}"
+
 class DomainCLI:
     """Command-line interface for domain management."""
     
+    # Application header, rendered on first use since the banner never changes
+    _HEADER = None
+    
     def __init__(self, godaddy_client):
         """
         Initialize the CLI interface.
@@ -27,16 +95,99 @@ class DomainCLI:
         self.godaddy_client = godaddy_client
         self.logger = logging.getLogger("domain_manager")
         self.contact_info = {}
+        
+        # Recent suggestion/search results. Plain availability checks are
+        # left to the client's own cache.
+        self._result_cache = TTLCache(maxsize=_CACHE_MAX, ttl=_CACHE_TTL)
     
     def print_header(self):
         """Print the application header."""
-        os.system('cls' if os.name == 'nt' else 'clear')
-        header = pyfiglet.figlet_format("GoDaddy Domain Manager", font="slant")
-        print(f"{Fore.CYAN}{header}{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Automate your domain registration process{Style.RESET_ALL}")
-        print("-" * 80)
+        if DomainCLI._HEADER is None:
+            # Imported here so pyfiglet's font loading is only paid when needed
+            import pyfiglet
+            
+            DomainCLI._HEADER = (
+                f"{Fore.CYAN}{pyfiglet.figlet_format('GoDaddy Domain Manager', font='slant')}{Style.RESET_ALL}\n"
+                f"{Fore.YELLOW}Automate your domain registration process{Style.RESET_ALL}\n"
+                + "-" * 80 + "\n"
+            )
+        
+        # Clear the screen with ANSI codes (translated by colorama on Windows)
+        # rather than spawning a cls/clear process
+        sys.stdout.write(_CLEAR_SCREEN + self._HEADER)
+        sys.stdout.flush()
+    
+    def _prompt_int(self, prompt, lo, hi):
+        """
+        Prompt until the user enters a whole number within a range.
+        
+        Args:
+            prompt (str): Prompt to display
+            lo (int): Smallest accepted value
+            hi (int): Largest accepted value
+            
+        Returns:
+            int: The number entered
+        """
+        out_of_range = f"{Fore.RED}Invalid choice. Please enter a number between {lo} and {hi}.{Style.RESET_ALL}"
+        
+        while True:
+            try:
+                value = int(input(prompt))
+            except ValueError:
+                print(_NOT_A_NUMBER)
+                continue
+            
+            if lo <= value <= hi:
+                return value
+            print(out_of_range)
+    
+    async def _cached(self, key, fetch):
+        """
+        Return a remembered API result, or fetch and remember it.
+        
+        Args:
+            key (tuple): Cache key, e.g. (operation, keyword, tlds)
+            fetch (callable): Returns the API call to await on a miss
+            
+        Returns:
+            The API result
+        """
+        cache = self._result_cache
+        if key in cache:
+            return cache[key]
+        
+        result = await fetch()
+        
+        # Only remember successful, non-empty results. Suggestions come back
+        # without availability when that lookup fails; fetch those again.
+        if not result or (isinstance(result, dict) and "error" in result):
+            return result
+        if isinstance(result, list) and any("available" not in item for item in result):
+            return result
+        
+        cache[key] = result
+        return result
+    
+    async def _with_spinner(self, coro):
+        """
+        Await an API call while showing a simple spinner.
+        
+        Args:
+            coro (coroutine): API call to await
+            
+        Returns:
+            The result of the API call
+        """
+        task = asyncio.ensure_future(coro)
+        while not task.done():
+            sys.stdout.write('.')
+            sys.stdout.flush()
+            await asyncio.wait({task}, timeout=0.1)
+        print()
+        return task.result()
     
-    def start(self):
+    async def start(self):
         """Start the CLI interface and guide the user through the domain process."""
         self.print_header()
         
@@ -45,30 +196,25 @@ class DomainCLI:
         print()
         
         while True:
-            print(f"{Fore.CYAN}MAIN MENU{Style.RESET_ALL}")
-            print("1. Check domain availability")
-            print("2. Search for domains")
-            print("3. Purchase a domain")
-            print("4. Exit")
+            sys.stdout.write(_MAIN_MENU)
+            sys.stdout.flush()
             
-            try:
-                choice = int(input(f"{Fore.YELLOW}Enter your choice (1-4): {Style.RESET_ALL}"))
-                
-                if choice == 1:
-                    self.check_domain_flow()
-                elif choice == 2:
-                    self.search_domains_flow()
-                elif choice == 3:
-                    self.purchase_domain_flow()
-                elif choice == 4:
-                    print(f"{Fore.YELLOW}Thank you for using GoDaddy Domain Manager!{Style.RESET_ALL}")
-                    sys.exit(0)
-                else:
-                    print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and 4.{Style.RESET_ALL}")
-            except ValueError:
-                print(f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}")
+            choice = self._prompt_int(f"{Fore.YELLOW}Enter your choice (1-5): {Style.RESET_ALL}", 1, 5)
+            
+            if choice == 1:
+                await self.check_domain_flow()
+            elif choice == 2:
+                await self.search_domains_flow()
+            elif choice == 3:
+                await self.purchase_domain_flow()
+            elif choice == 4:
+                self.contact_info = {}
+                print(f"{Fore.YELLOW}Contact information cleared.{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.YELLOW}Thank you for using GoDaddy Domain Manager!{Style.RESET_ALL}")
+                return
     
-    def check_domain_flow(self):
+    async def check_domain_flow(self):
         """Flow for checking domain availability."""
         self.print_header()
         print(f"{Fore.GREEN}Domain Availability Check{Style.RESET_ALL}")
@@ -85,42 +231,45 @@ class DomainCLI:
             
             print(f"{Fore.YELLOW}Checking availability for {domain_name}...{Style.RESET_ALL}")
             
-            # Show a simple spinner
-            for _ in range(3):
-                sys.stdout.write('.')
-                sys.stdout.flush()
-                time.sleep(0.5)
-            print()
-            
-            result = self.godaddy_client.check_domain_availability(domain_name)
+            # Show a spinner while the check is in flight
+            result = await self._with_spinner(self.godaddy_client.check_domain_availability(domain_name))
             
             if "error" in result:
                 print(f"{Fore.RED}Error checking domain: {result['error']}{Style.RESET_ALL}")
                 continue
             
             if result.get('available', False):
-                price = result.get('price', 0) / 1000000  # Convert from micros to standard currency
                 print(f"{Fore.GREEN}Good news! {domain_name} is available for purchase!{Style.RESET_ALL}")
-                print(f"Price: ${price:.2f} per year")
+                print(f"Price: {_fmt_price(result.get('price', 0))} per year")
                 
                 # Ask if user wants to purchase the domain
                 purchase_action = input(f"{Fore.YELLOW}Would you like to purchase this domain? (y/n): {Style.RESET_ALL}").lower()
                 
                 if purchase_action == 'y':
-                    self.purchase_domain_flow(domain_name)
+                    await self.purchase_domain_flow(domain_name)
                     break
             else:
                 print(f"{Fore.RED}{domain_name} is not available.{Style.RESET_ALL}")
                 
                 # Get suggestions for similar domains
                 print(f"{Fore.YELLOW}Getting suggestions for similar domains...{Style.RESET_ALL}")
-                suggestions = self.godaddy_client.get_suggested_domains(domain_name)
+                keyword = domain_name.split('.')[0]
+                suggestions = await self._cached(
+                    ("suggest", keyword.lower()),
+                    lambda: self.godaddy_client.get_suggested_with_availability(keyword, limit=5)
+                )
+                
+                # Only offer alternatives that are actually available
+                if "error" in suggestions:
+                    self.logger.warning(f"Could not get suggestions: {suggestions['error']}")
+                    suggestions = []
+                suggestions = [domain for domain in suggestions if domain.get('available', False)]
                 
                 if suggestions and len(suggestions) > 0:
+                    suggestions_top = suggestions[:5]
                     print(f"{Fore.GREEN}Here are some available alternatives:{Style.RESET_ALL}")
-                    for i, domain in enumerate(suggestions[:5], 1):
-                        price = domain.get('price', 0) / 1000000  # Convert from micros to standard currency
-                        print(f"{i}. {domain['domain']} - ${price:.2f} per year")
+                    for i, domain in enumerate(suggestions_top, 1):
+                        print(f"{i}. {domain['domain']} - {_fmt_price(domain.get('price', 0))} per year")
                     
                     # Ask if user wants to purchase any of the suggested domains
                     suggestion_action = input(f"{Fore.YELLOW}Would you like to purchase any of these domains? (y/n): {Style.RESET_ALL}").lower()
@@ -128,17 +277,17 @@ class DomainCLI:
                     if suggestion_action == 'y':
                         while True:
                             try:
-                                selected_num = input(f"{Fore.CYAN}Enter domain number to purchase (1-{len(suggestions[:5])}) or 'back' to return: {Style.RESET_ALL}")
+                                selected_num = input(f"{Fore.CYAN}Enter domain number to purchase (1-{len(suggestions_top)}) or 'back' to return: {Style.RESET_ALL}")
                                 
                                 if selected_num.lower() == 'back':
                                     break
                                     
                                 selected_idx = int(selected_num) - 1
-                                if 0 <= selected_idx < len(suggestions[:5]):
-                                    selected_domain = suggestions[selected_idx]['domain']
-                                    self.purchase_domain_flow(selected_domain)
+                                if 0 <= selected_idx < len(suggestions_top):
+                                    selected_domain = suggestions_top[selected_idx]['domain']
+                                    await self.purchase_domain_flow(selected_domain)
                                     return
-                                print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and {len(suggestions[:5])}.{Style.RESET_ALL}")
+                                print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and {len(suggestions_top)}.{Style.RESET_ALL}")
                             except ValueError:
                                 print(f"{Fore.RED}Invalid input. Please enter a number or 'back'.{Style.RESET_ALL}")
                 else:
@@ -150,7 +299,7 @@ class DomainCLI:
             if check_again != 'y':
                 break
     
-    def search_domains_flow(self):
+    async def search_domains_flow(self):
         """Flow for searching for domains based on keywords."""
         self.print_header()
         print(f"{Fore.GREEN}Domain Search{Style.RESET_ALL}")
@@ -161,21 +310,10 @@ class DomainCLI:
             return
         
         # Get TLDs to search
-        print(f"{Fore.CYAN}Select TLD options:{Style.RESET_ALL}")
-        print("1. All popular TLDs")
-        print("2. .com, .net, .org only")
-        print("3. .io, .dev, .tech (tech domains)")
-        print("4. .ai, .app, .co (startup domains)")
-        print("5. Custom selection")
+        sys.stdout.write(_TLD_MENU)
+        sys.stdout.flush()
         
-        while True:
-            try:
-                tld_choice = int(input(f"{Fore.YELLOW}Enter your choice (1-5): {Style.RESET_ALL}"))
-                if 1 <= tld_choice <= 5:
-                    break
-                print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and 5.{Style.RESET_ALL}")
-            except ValueError:
-                print(f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}")
+        tld_choice = self._prompt_int(f"{Fore.YELLOW}Enter your choice (1-5): {Style.RESET_ALL}", 1, 5)
         
         # Set the TLDs based on the selection
         if tld_choice == 1:
@@ -197,14 +335,13 @@ class DomainCLI:
         
         print(f"{Fore.YELLOW}Searching for domains related to '{keyword}'...{Style.RESET_ALL}")
         
-        # Show a simple spinner
-        for _ in range(3):
-            sys.stdout.write('.')
-            sys.stdout.flush()
-            time.sleep(0.5)
-        print()
-        
-        results = self.godaddy_client.search_domains(keyword, tlds=selected_tlds)
+        # Show a spinner while the search is in flight
+        results = await self._with_spinner(
+            self._cached(
+                ("search", keyword.lower(), tuple(selected_tlds)),
+                lambda: self.godaddy_client.get_suggested_with_availability(keyword, tlds=selected_tlds)
+            )
+        )
         
         if "error" in results:
             print(f"{Fore.RED}Error searching domains: {results['error']}{Style.RESET_ALL}")
@@ -217,9 +354,9 @@ class DomainCLI:
         print(f"{Fore.GREEN}Found {len(results)} domains related to '{keyword}':{Style.RESET_ALL}")
         
         # Display domains with prices
-        for i, domain in enumerate(results[:10], 1):
-            price = domain.get('price', 0) / 1000000  # Convert from micros to standard currency
-            print(f"{i}. {domain['domain']} - ${price:.2f} per year")
+        results_top = results[:10]
+        for i, domain in enumerate(results_top, 1):
+            print(f"{i}. {domain['domain']} - {_fmt_price(domain.get('price', 0))} per year")
         
         # Ask if user wants to purchase any of the domains
         purchase_action = input(f"{Fore.YELLOW}Would you like to purchase any of these domains? (y/n): {Style.RESET_ALL}").lower()
@@ -227,17 +364,17 @@ class DomainCLI:
         if purchase_action == 'y':
             while True:
                 try:
-                    selected_num = input(f"{Fore.CYAN}Enter domain number to purchase (1-{len(results[:10])}) or 'back' to return: {Style.RESET_ALL}")
+                    selected_num = input(f"{Fore.CYAN}Enter domain number to purchase (1-{len(results_top)}) or 'back' to return: {Style.RESET_ALL}")
                     
                     if selected_num.lower() == 'back':
                         return
                         
                     selected_idx = int(selected_num) - 1
-                    if 0 <= selected_idx < len(results[:10]):
-                        selected_domain = results[selected_idx]['domain']
-                        self.purchase_domain_flow(selected_domain)
+                    if 0 <= selected_idx < len(results_top):
+                        selected_domain = results_top[selected_idx]['domain']
+                        await self.purchase_domain_flow(selected_domain)
                         break
-                    print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and {len(results[:10])}.{Style.RESET_ALL}")
+                    print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and {len(results_top)}.{Style.RESET_ALL}")
                 except ValueError:
                     print(f"{Fore.RED}Invalid input. Please enter a number or 'back'.{Style.RESET_ALL}")
     
@@ -247,7 +384,8 @@ class DomainCLI:
         print(f"{Fore.GREEN}Contact Information{Style.RESET_ALL}")
         print("Please provide the registrant contact information for the domain:")
         
-        self.contact_info = {}
+        if self.contact_info:
+            print(f"{Fore.YELLOW}Reusing the details entered earlier. Use 'Reset contact info' in the main menu to change them.{Style.RESET_ALL}")
         
         fields = [
             ('firstName', 'First Name'),
@@ -263,6 +401,10 @@ class DomainCLI:
         ]
         
         for field_name, field_desc in fields:
+            # Skip fields already entered and validated earlier in this session
+            if field_name in self.contact_info:
+                continue
+            
             required = field_name != 'addressLine2'
             
             while True:
@@ -288,32 +430,17 @@ class DomainCLI:
                 
             self.contact_info[field_name] = value
         
-        # Create contacts in the format GoDaddy expects
-        # Mapping our fields to GoDaddy's expected format
-        formatted_contact = {
-            "nameFirst": self.contact_info.get("firstName", ""),
-            "nameLast": self.contact_info.get("lastName", ""),
-            "email": self.contact_info.get("email", ""),
-            "phone": self.contact_info.get("phone", ""),
-            "addressMailing": {
-                "address1": self.contact_info.get("addressLine1", ""),
-                "address2": self.contact_info.get("addressLine2", ""),
-                "city": self.contact_info.get("city", ""),
-                "state": self.contact_info.get("state", ""),
-                "postalCode": self.contact_info.get("postalCode", ""),
-                "country": self.contact_info.get("country", "US")
-            }
-        }
-        
-        # Use the same contact info for all contact types
+        # Use the same contact info for all contact types. It stays in our
+        # field names; the client maps it to GoDaddy's format once.
+        contact = dict(self.contact_info)
         return {
-            "contactAdmin": formatted_contact,
-            "contactBilling": formatted_contact,
-            "contactRegistrant": formatted_contact,
-            "contactTech": formatted_contact
+            "contactAdmin": contact,
+            "contactBilling": contact,
+            "contactRegistrant": contact,
+            "contactTech": contact
         }
     
-    def purchase_domain_flow(self, domain_name=None):
+    async def purchase_domain_flow(self, domain_name=None):
         """
         Flow for purchasing a domain.
         
@@ -335,7 +462,7 @@ class DomainCLI:
             
             # Check availability before proceeding
             print(f"{Fore.YELLOW}Checking availability for {domain_name}...{Style.RESET_ALL}")
-            result = self.godaddy_client.check_domain_availability(domain_name)
+            result = await self.godaddy_client.check_domain_availability(domain_name)
             
             if "error" in result:
                 print(f"{Fore.RED}Error checking domain: {result['error']}{Style.RESET_ALL}")
@@ -345,58 +472,30 @@ class DomainCLI:
                 print(f"{Fore.RED}{domain_name} is not available for purchase.{Style.RESET_ALL}")
                 return
             
-            price = result.get('price', 0) / 1000000  # Convert from micros to standard currency
-            print(f"{Fore.GREEN}{domain_name} is available for ${price:.2f} per year.{Style.RESET_ALL}")
+            print(f"{Fore.GREEN}{domain_name} is available for {_fmt_price(result.get('price', 0))} per year.{Style.RESET_ALL}")
         
         # Ask for registration period
-        print(f"{Fore.CYAN}Select registration period:{Style.RESET_ALL}")
-        print("1. 1 year")
-        print("2. 2 years")
-        print("3. 3 years")
-        print("4. 5 years")
-        print("5. 10 years")
+        sys.stdout.write(_PERIOD_MENU)
+        sys.stdout.flush()
         
-        while True:
-            try:
-                period_choice = int(input("Enter your choice (1-5): "))
-                if 1 <= period_choice <= 5:
-                    break
-                print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and 5.{Style.RESET_ALL}")
-            except ValueError:
-                print(f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}")
+        period_choice = self._prompt_int("Enter your choice (1-5): ", 1, 5)
         
         period_options = {1: 1, 2: 2, 3: 3, 4: 5, 5: 10}
         period = period_options[period_choice]
         
         # Ask for privacy protection
-        print(f"{Fore.CYAN}Would you like to add privacy protection?{Style.RESET_ALL}")
-        print("1. Yes, protect my personal information")
-        print("2. No, make my information public")
+        sys.stdout.write(_PRIVACY_MENU)
+        sys.stdout.flush()
         
-        while True:
-            try:
-                privacy_choice = int(input("Enter your choice (1-2): "))
-                if 1 <= privacy_choice <= 2:
-                    break
-                print(f"{Fore.RED}Invalid choice. Please enter 1 or 2.{Style.RESET_ALL}")
-            except ValueError:
-                print(f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}")
+        privacy_choice = self._prompt_int("Enter your choice (1-2): ", 1, 2)
         
         privacy = privacy_choice == 1
         
         # Ask for auto-renewal
-        print(f"{Fore.CYAN}Would you like to enable auto-renewal?{Style.RESET_ALL}")
-        print("1. Yes, automatically renew this domain")
-        print("2. No, I will renew manually")
+        sys.stdout.write(_RENEW_MENU)
+        sys.stdout.flush()
         
-        while True:
-            try:
-                renew_choice = int(input("Enter your choice (1-2): "))
-                if 1 <= renew_choice <= 2:
-                    break
-                print(f"{Fore.RED}Invalid choice. Please enter 1 or 2.{Style.RESET_ALL}")
-            except ValueError:
-                print(f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}")
+        renew_choice = self._prompt_int("Enter your choice (1-2): ", 1, 2)
         
         auto_renew = renew_choice == 1
         
@@ -411,8 +510,7 @@ class DomainCLI:
         }
         
         # Add contact information
-        for key, value in contact_info.items():
-            purchase_options[key] = value
+        purchase_options.update(contact_info)
         
         # Confirm purchase
         self.print_header()
@@ -431,7 +529,7 @@ class DomainCLI:
         
         # Process purchase
         print(f"{Fore.YELLOW}Processing purchase...{Style.RESET_ALL}")
-        result = self.godaddy_client.purchase_domain(domain_name, purchase_options)
+        result = await self.godaddy_client.purchase_domain(domain_name, purchase_options)
         
         if "error" in result:
             error_details = result["error"]
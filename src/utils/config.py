@@ -8,12 +8,17 @@ from logging.handlers import RotatingFileHandler
 
 def setup_logger():
     """Set up and configure the application logger."""
+    logger = logging.getLogger("domain_manager")
+    
+    # Already configured; adding handlers again would duplicate every message
+    if logger.handlers:
+        return logger
+    
     log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
-    logger = logging.getLogger("domain_manager")
     logger.setLevel(logging.INFO)
+    logger.propagate = False
     
     # Create handlers
     file_handler = RotatingFileHandler(
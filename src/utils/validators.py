@@ -3,8 +3,22 @@ Validation utilities for the GoDaddy Domain Management tool.
 """
 
 import re
+import functools
 import validators
 
+# Domain name regex pattern (simplified)
+_DOMAIN_RE = re.compile(r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9]$")
+
+# Basic international phone number format with optional + prefix
+_PHONE_RE = re.compile(r"^\+?[0-9]{10,15}$")
+
+# Contact fields that must be present and non-empty for registration
+_REQUIRED_CONTACT_FIELDS = (
+    "firstName", "lastName", "email", "phone",
+    "addressLine1", "city", "state", "postalCode", "country"
+)
+
+@functools.lru_cache(maxsize=1024)
 def validate_domain_name(domain):
     """
     Validate a domain name format.
@@ -19,15 +33,12 @@ def validate_domain_name(domain):
     if not domain or len(domain) > 253:
         return False
     
-    # Use validators library as primary validation
-    if validators.domain(domain):
+    # Cheap precompiled regex covers the common case
+    if _DOMAIN_RE.match(domain):
         return True
     
-    # Additional validation for specific cases
-    # Domain name regex pattern (simplified)
-    pattern = r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9]$"
-    
-    return bool(re.match(pattern, domain))
+    # Fall back to the validators library for edge cases
+    return bool(validators.domain(domain))
 
 def validate_contact_info(contact_info):
     """
@@ -39,26 +50,21 @@ def validate_contact_info(contact_info):
     Returns:
         tuple: (is_valid, error_message)
     """
-    required_fields = [
-        "firstName", "lastName", "email", "phone",
-        "addressLine1", "city", "state", "postalCode", "country"
-    ]
-    
-    for field in required_fields:
+    for field in _REQUIRED_CONTACT_FIELDS:
         if field not in contact_info or not contact_info[field]:
             return False, f"Missing required field: {field}"
     
     # Validate email
-    if not validators.email(contact_info["email"]):
+    if not validate_email(contact_info["email"]):
         return False, "Invalid email address"
     
     # Validate phone number (basic validation)
-    phone_pattern = r"^\+?[0-9]{10,15}$"
-    if not re.match(phone_pattern, contact_info["phone"]):
+    if not validate_phone(contact_info["phone"]):
         return False, "Invalid phone number format"
     
     return True, ""
 
+@functools.lru_cache(maxsize=1024)
 def validate_email(email):
     """
     Validate email format.
@@ -72,16 +78,9 @@ def validate_email(email):
     if not email:
         return False
         
-    # Use validators library if available
-    try:
-        import validators
-        return validators.email(email)
-    except (ImportError, AttributeError):
-        # Fallback to regex validation
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+    return bool(validators.email(email))
 
+@functools.lru_cache(maxsize=1024)
 def validate_phone(phone):
     """
     Validate phone number format.
@@ -95,7 +94,4 @@ def validate_phone(phone):
     if not phone:
         return False
         
-    import re
-    # Basic international phone number format with optional + prefix
-    pattern = r'^\+?[0-9]{10,15}$'
-    return bool(re.match(pattern, phone)) 
\ No newline at end of file
+    return bool(_PHONE_RE.match(phone)) 
\ No newline at end of file
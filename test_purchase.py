@@ -9,14 +9,117 @@ documentation.
 
 import os
 import sys
-import json
+import logging
+import argparse
 import time
-import requests
+import random
+import types
+import sqlite3
+import asyncio
+import aiohttp
+import orjson
+from cachetools import TTLCache
+from cachetools.keys import hashkey
 from dotenv import load_dotenv
 
+try:
+    # Enables aiohttp's non-blocking AsyncResolver
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    # Faster libuv-based event loop; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Load environment variables
 load_dotenv()
 
+# Request headers, built once since the credentials are only read at startup
+_AUTH = f"sso-key {os.getenv('GODADDY_API_KEY')}:{os.getenv('GODADDY_API_SECRET')}"
+_HEADERS = types.MappingProxyType({
+    "Authorization": _AUTH,
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate"
+})
+
+# Set DEBUG_PURCHASE=1 to log full request and response details
+DEBUG = os.getenv("DEBUG_PURCHASE") == "1"
+
+# Purchase diagnostics go through a logger so formatting is skipped unless needed
+logger = logging.getLogger("purchase")
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_handler)
+logger.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+logger.propagate = False
+
+# Connection pool size; connections are kept alive and reused across calls
+POOL_SIZE = 10
+
+# Seconds an idle connection (and its TLS session) is kept; long enough to
+# survive the confirm prompt between the availability check and the purchase
+KEEPALIVE_TIMEOUT = 60
+
+# Seconds the resolved API host address is cached
+DNS_CACHE_TTL = 300
+
+# Seconds allowed for the TCP/TLS connect and for each read
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 15
+
+# Retry policy for idempotent (availability) requests
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Maximum bytes of a non-JSON or error response body read for display
+MAX_DISPLAY_BODY = 65536
+
+# Recent availability results, kept for AVAIL_TTL seconds (default 300)
+_avail_cache = TTLCache(maxsize=1024, ttl=int(os.getenv("AVAIL_TTL", "300")))
+
+# On-disk availability cache that survives between runs, opened on first use.
+# Its per-TLD TTLs are independent of AVAIL_TTL; pass --refresh to bypass it.
+AVAIL_DB_PATH = os.path.expanduser("~/.gd_avail_cache.sqlite")
+_avail_db = None
+
+# Seconds an on-disk availability result stays valid, by TLD
+_TLD_TTLS = {"com": 24 * 3600}
+_DEFAULT_TLD_TTL = 6 * 3600
+
+# Test contact info in the format expected by GoDaddy API
+_CONTACT_INFO = {
+    "nameFirst": "Test",
+    "nameLast": "User",
+    "email": "test@example.com",
+    "phone": "+11234567890",
+    "addressMailing": {
+        "address1": "123 Test St",
+        "address2": "",
+        "city": "Test City",
+        "state": "TS",
+        "postalCode": "12345",
+        "country": "US"
+    }
+}
+
+# Purchase request fields shared by every domain; the domain and consent are
+# added per request. Format follows the GoDaddy API requirements:
+# https://developer.godaddy.com/doc/endpoint/domains#/v1/purchase
+_PURCHASE_TEMPLATE = {
+    "period": 1,
+    "renewAuto": True,
+    "privacy": True,
+    "contactAdmin": _CONTACT_INFO,
+    "contactBilling": _CONTACT_INFO,
+    "contactRegistrant": _CONTACT_INFO,
+    "contactTech": _CONTACT_INFO
+}
+
 def get_api_credentials():
     """Get API credentials from environment variables."""
     api_key = os.getenv("GODADDY_API_KEY")
@@ -29,147 +132,342 @@ def get_api_credentials():
     
     return api_key, api_secret, api_url
 
-def check_domain_availability(api_key, api_secret, api_url, domain_name):
-    """Check if a domain is available for purchase."""
+def create_session():
+    """Create the HTTP session shared by all API calls."""
+    # Resolve the API host once (through aiodns when available) and reuse the
+    # address for later connections instead of calling getaddrinfo each time
+    connector = aiohttp.TCPConnector(
+        resolver=aiohttp.AsyncResolver() if aiodns else None,
+        limit=POOL_SIZE,
+        limit_per_host=POOL_SIZE,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT
+    )
+    timeout = aiohttp.ClientTimeout(sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, headers=_HEADERS, timeout=timeout)
+
+async def request_with_retry(session, method, url, **kwargs):
+    """
+    Send an idempotent request, retrying transient failures with exponential
+    backoff and jitter. The returned response must be released by the caller,
+    e.g. by using it as an async context manager.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        last_attempt = attempt == RETRY_ATTEMPTS - 1
+        try:
+            response = await session.request(method, url, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+        else:
+            if last_attempt or response.status not in RETRY_STATUSES:
+                return response
+            response.release()
+        
+        await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt * random.uniform(0.5, 1.5))
+
+async def read_truncated(response, limit=MAX_DISPLAY_BODY):
+    """Read at most limit bytes of a response body and decode them for display."""
+    body = b""
+    while len(body) < limit:
+        chunk = await response.content.read(limit - len(body))
+        if not chunk:
+            break
+        body += chunk
+    return body.decode(response.charset or "utf-8", errors="replace")
+
+async def print_error_response(response):
+    """Print the (possibly truncated) body of a failed API response."""
+    body = await read_truncated(response)
+    if response.content_type == "application/json":
+        try:
+            print(f"Response: {orjson.loads(body)}")
+            return
+        except orjson.JSONDecodeError:
+            pass
+    print(f"Response: {body}")
+
+def get_avail_db():
+    """Open the on-disk availability cache, creating its table if needed."""
+    global _avail_db
+    if _avail_db is None:
+        _avail_db = sqlite3.connect(AVAIL_DB_PATH, isolation_level=None)
+        _avail_db.execute("PRAGMA journal_mode=WAL")
+        _avail_db.execute("PRAGMA synchronous=NORMAL")
+        _avail_db.execute(
+            "CREATE TABLE IF NOT EXISTS avail("
+            "api TEXT, domain TEXT, body BLOB, expires REAL, PRIMARY KEY (api, domain))"
+        )
+    return _avail_db
+
+def ttl_for_tld(domain_name):
+    """Return how long an availability result for the domain may be cached."""
+    return _TLD_TTLS.get(domain_name.rsplit(".", 1)[-1], _DEFAULT_TLD_TTL)
+
+def get_cached_availability(api_url, domain_name):
+    """Return a cached availability result from memory or disk, or None."""
+    key = hashkey(api_url, domain_name)
+    if key in _avail_cache:
+        return _avail_cache[key]
+    
+    row = get_avail_db().execute(
+        "SELECT body, expires FROM avail WHERE api = ? AND domain = ?", (api_url, domain_name)
+    ).fetchone()
+    if row is None or row[1] <= time.time():
+        return None
+    
+    result = orjson.loads(row[0])
+    _avail_cache[key] = result
+    return result
+
+def cache_availability(api_url, domain_name, result):
+    """Store a successful availability result in memory and on disk."""
+    _avail_cache[hashkey(api_url, domain_name)] = result
+    get_avail_db().execute(
+        "INSERT OR REPLACE INTO avail VALUES (?, ?, ?, ?)",
+        (api_url, domain_name, orjson.dumps(result), time.time() + ttl_for_tld(domain_name))
+    )
+
+async def read_json(response):
+    """Return a response's parsed JSON body, or None after printing a non-JSON body."""
+    # Proxies and captive portals may answer 200 with a large HTML page
+    if response.content_type != "application/json":
+        print(f"Response Body (text): {await read_truncated(response)}")
+        return None
+    
+    body = await response.read()
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        print(f"Response Body (text): {body[:MAX_DISPLAY_BODY].decode(errors='replace')}")
+        return None
+
+async def check_domain_availability(session, api_url, domain_name, refresh=False):
+    """Check if a domain is available for purchase, ignoring cached results if refresh is set."""
+    cached = None if refresh else get_cached_availability(api_url, domain_name.lower())
+    if cached is not None:
+        return cached
+    
     url = f"https://{api_url}/v1/domains/available"
-    headers = {
-        "Authorization": f"sso-key {api_key}:{api_secret}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
     params = {"domain": domain_name}
     
     try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        async with await request_with_retry(session, "GET", url, params=params) as response:
+            if response.status >= 400:
+                error = f"{response.status} {response.reason} for url: {response.url}"
+                print(f"Error checking domain availability: {error}")
+                await print_error_response(response)
+                return {"error": error}
+            result = await read_json(response)
+            if result is None:
+                print("Error checking domain availability: invalid JSON response")
+                return {"error": "Invalid JSON response"}
+            cache_availability(api_url, domain_name.lower(), result)
+            return result
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"Error checking domain availability: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            try:
-                print(f"Response: {e.response.json()}")
-            except:
-                print(f"Response: {e.response.text}")
         return {"error": str(e)}
 
-def purchase_domain(api_key, api_secret, api_url, domain_name):
-    """Attempt to purchase a domain with detailed error reporting."""
-    url = f"https://{api_url}/v1/domains/purchase"
-    headers = {
-        "Authorization": f"sso-key {api_key}:{api_secret}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+async def check_domains_bulk(session, api_url, domains, refresh=False):
+    """Check availability of several domains in one request, keyed by lowercased domain."""
+    results = {}
+    uncached = []
+    for domain_name in domains:
+        cached = None if refresh else get_cached_availability(api_url, domain_name.lower())
+        if cached is not None:
+            results[domain_name.lower()] = cached
+        else:
+            uncached.append(domain_name)
+    
+    if not uncached:
+        return results
     
-    # Create test contact info in the format expected by GoDaddy API
-    contact_info = {
-        "nameFirst": "Test",
-        "nameLast": "User",
-        "email": "test@example.com",
-        "phone": "+11234567890",
-        "addressMailing": {
-            "address1": "123 Test St",
-            "address2": "",
-            "city": "Test City",
-            "state": "TS",
-            "postalCode": "12345",
-            "country": "US"
-        }
+    url = f"https://{api_url}/v1/domains/available"
+    params = {"checkType": "FAST"}
+    
+    try:
+        async with await request_with_retry(
+            session, "POST", url, params=params, data=orjson.dumps(uncached)
+        ) as response:
+            if response.status >= 400:
+                error = f"{response.status} {response.reason} for url: {response.url}"
+                print(f"Error checking domain availability: {error}")
+                await print_error_response(response)
+                results.update((domain_name.lower(), {"error": error}) for domain_name in uncached)
+                return results
+            body = await read_json(response)
+            if body is None:
+                print("Error checking domain availability: invalid JSON response")
+                results.update((domain_name.lower(), {"error": "Invalid JSON response"}) for domain_name in uncached)
+                return results
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Error checking domain availability: {e}")
+        results.update((domain_name.lower(), {"error": str(e)}) for domain_name in uncached)
+        return results
+    
+    for result in body.get("domains", []):
+        domain_name = result["domain"].lower()
+        cache_availability(api_url, domain_name, result)
+        results[domain_name] = result
+    
+    for error in body.get("errors", []):
+        results[error.get("domain", "").lower()] = {"error": error.get("message", error)}
+    
+    return results
+
+def make_consent():
+    """Build the purchase agreement consent, timestamped now."""
+    return {
+        "agreementKeys": ["DNRA"],
+        "agreedBy": "127.0.0.1",
+        "agreedAt": time.time_ns() // 1_000_000
     }
+
+async def purchase_domain(session, api_url, domain_name, consent=None):
+    """Attempt to purchase a domain with detailed error reporting."""
+    url = f"https://{api_url}/v1/domains/purchase"
     
-    # Format data according to GoDaddy API requirements
-    # Reference: https://developer.godaddy.com/doc/endpoint/domains#/v1/purchase
     data = {
+        **_PURCHASE_TEMPLATE,
         "domain": domain_name,
-        "consent": {
-            "agreementKeys": ["DNRA"],
-            "agreedBy": "127.0.0.1",
-            "agreedAt": int(time.time() * 1000)
-        },
-        "period": 1,
-        "renewAuto": True,
-        "privacy": True,
-        "contactAdmin": contact_info,
-        "contactBilling": contact_info,
-        "contactRegistrant": contact_info,
-        "contactTech": contact_info
+        "consent": consent or make_consent()
     }
     
-    print("\n=== REQUEST DETAILS ===")
-    print(f"URL: {url}")
-    print(f"Headers: {headers}")
-    print(f"Request Body: {json.dumps(data, indent=2)}")
+    logger.debug("\n=== REQUEST DETAILS ===")
+    logger.debug("URL: %s", url)
+    if DEBUG:
+        logger.debug("Headers: %s", dict(session.headers))
+        logger.debug("Request Body: %s", orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
     
     try:
-        response = requests.post(url, headers=headers, json=data)
-        
-        print("\n=== RESPONSE DETAILS ===")
-        print(f"Status Code: {response.status_code}")
-        print(f"Response Headers: {response.headers}")
-        
-        try:
-            response_json = response.json()
-            print(f"Response Body: {json.dumps(response_json, indent=2)}")
-            return response_json
-        except json.JSONDecodeError:
-            print(f"Response Body (text): {response.text}")
-            return {"error": "Invalid JSON response"}
+        async with session.post(url, data=orjson.dumps(data)) as response:
+            logger.debug("\n=== RESPONSE DETAILS ===")
+            logger.debug("Status Code: %s", response.status)
+            logger.debug("Response Headers: %s", response.headers)
             
-    except requests.exceptions.RequestException as e:
-        print(f"Error purchasing domain: {e}")
-        if hasattr(e, 'response') and e.response is not None:
+            # Proxies may answer with large HTML error pages; only show their start
+            if response.content_type != "application/json":
+                logger.error("Response Body (text): %s", await read_truncated(response))
+                return {"error": "Invalid JSON response"}
+            
+            body = await response.read()
             try:
-                print(f"Response: {e.response.json()}")
-            except:
-                print(f"Response: {e.response.text}")
+                response_json = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                logger.error("Response Body (text): %s", body[:MAX_DISPLAY_BODY].decode(errors="replace"))
+                return {"error": "Invalid JSON response"}
+            
+            if response.status >= 400:
+                logger.error("Purchase of %s failed with status %s: %s", domain_name, response.status, response_json)
+                return {"error": response_json}
+            
+            logger.debug("Response Body: %s", orjson.dumps(response_json, option=orjson.OPT_INDENT_2).decode())
+            logger.info("purchased %s orderId=%s", domain_name, response_json.get("orderId"))
+            return response_json
+            
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Error purchasing domain: %s", e)
         return {"error": str(e)}
 
-def main():
-    """Main function to test domain purchase."""
-    api_key, api_secret, api_url = get_api_credentials()
-    
-    print(f"Using API URL: {api_url}")
-    print(f"API Key: {api_key[:5]}...{api_key[-3:]}")
-    
-    # Get domain name from command line or prompt
-    if len(sys.argv) > 1:
-        domain_name = sys.argv[1]
+async def purchase_batch(session, api_url, domain_names):
+    """Purchase several domains concurrently, sharing one consent timestamp."""
+    consent = make_consent()
+    return await asyncio.gather(
+        *(purchase_domain(session, api_url, domain_name, consent) for domain_name in domain_names)
+    )
+
+async def check_before_purchase(session, api_url, domain_names, refresh=False):
+    """Check availability of the domains and return those the user confirms."""
+    # Check availability, in a single request when there are several domains
+    print(f"\nChecking availability for {', '.join(domain_names)}...")
+    if len(domain_names) > 1:
+        by_domain = await check_domains_bulk(session, api_url, domain_names, refresh)
+        results = [
+            by_domain.get(domain_name.lower(), {"error": "No availability data returned"})
+            for domain_name in domain_names
+        ]
     else:
-        domain_name = input("Enter a domain name to purchase (e.g., example.com): ")
+        results = [await check_domain_availability(session, api_url, domain_names[0], refresh)]
     
-    # Check domain availability first
-    print(f"\nChecking availability for {domain_name}...")
-    result = check_domain_availability(api_key, api_secret, api_url, domain_name)
+    to_purchase = []
+    for domain_name, result in zip(domain_names, results):
+        if "error" in result:
+            print(f"Error checking domain {domain_name}: {result['error']}")
+            continue
+        
+        if not result.get('available', False):
+            print(f"{domain_name} is not available for purchase.")
+            continue
+        
+        price = result.get('price', 0) / 1000000  # Convert from micros to standard currency
+        print(f"{domain_name} is available for ${price:.2f} per year.")
+        
+        # Confirm purchase
+        confirm = input(f"Would you like to attempt to purchase {domain_name}? (y/n): ").lower()
+        if confirm != 'y':
+            print("Purchase cancelled.")
+            continue
+        
+        to_purchase.append(domain_name)
     
-    if "error" in result:
-        print(f"Error checking domain: {result['error']}")
-        return
+    return to_purchase
+
+async def main():
+    """Main function to test domain purchase."""
+    parser = argparse.ArgumentParser(description="Test the GoDaddy domain purchase API.")
+    parser.add_argument("domains", nargs="*", help="domain names to purchase")
+    parser.add_argument(
+        "--no-precheck",
+        action="store_true",
+        help="skip the availability check; the purchase call reports unavailable domains"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="ignore cached availability results (in memory and on disk) and check again"
+    )
+    args = parser.parse_args()
     
-    if not result.get('available', False):
-        print(f"{domain_name} is not available for purchase.")
-        return
+    api_key, api_secret, api_url = get_api_credentials()
     
-    price = result.get('price', 0) / 1000000  # Convert from micros to standard currency
-    print(f"{domain_name} is available for ${price:.2f} per year.")
+    print(f"Using API URL: {api_url}")
+    print(f"API Key: {api_key[:5]}...{api_key[-3:]}")
     
-    # Confirm purchase
-    confirm = input(f"Would you like to attempt to purchase {domain_name}? (y/n): ").lower()
-    if confirm != 'y':
-        print("Purchase cancelled.")
-        return
+    # Get domain names from command line or prompt
+    domain_names = args.domains or [input("Enter a domain name to purchase (e.g., example.com): ")]
     
-    # Attempt to purchase domain
-    print(f"\nAttempting to purchase {domain_name}...")
-    result = purchase_domain(api_key, api_secret, api_url, domain_name)
+    async with create_session() as session:
+        if args.no_precheck:
+            # The purchase call itself reports unavailable domains
+            to_purchase = []
+            for domain_name in domain_names:
+                confirm = input(f"Would you like to attempt to purchase {domain_name}? (y/n): ").lower()
+                if confirm != 'y':
+                    print("Purchase cancelled.")
+                    continue
+                to_purchase.append(domain_name)
+        else:
+            to_purchase = await check_before_purchase(session, api_url, domain_names, args.refresh)
+        
+        if not to_purchase:
+            return
+        
+        # Attempt to purchase the confirmed domains concurrently
+        print(f"\nAttempting to purchase {', '.join(to_purchase)}...")
+        results = await purchase_batch(session, api_url, to_purchase)
     
-    if "error" in result:
-        print(f"\nError purchasing domain: {result['error']}")
-    else:
-        print(f"\nPurchase initiated!")
-        if "paymentUrl" in result:
-            print(f"Payment URL: {result['paymentUrl']}")
-            print("Please complete payment at the URL above.")
-        print(f"Order ID: {result.get('orderId', 'N/A')}")
+    for domain_name, result in zip(to_purchase, results):
+        if "error" in result:
+            print(f"\nError purchasing {domain_name}: {result['error']}")
+        else:
+            print(f"\nPurchase initiated for {domain_name}!")
+            if "paymentUrl" in result:
+                print(f"Payment URL: {result['paymentUrl']}")
+                print("Please complete payment at the URL above.")
+            print(f"Order ID: {result.get('orderId', 'N/A')}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    if uvloop:
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file